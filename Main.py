@@ -1,7 +1,19 @@
+import calendar
+import time
 from datetime import datetime, date
 from enum import Enum
-from typing import List, Dict, Optional
-import uuid
+from functools import lru_cache
+from itertools import count
+from operator import attrgetter
+from typing import List, Dict, Optional, Tuple, Any, Sequence, Mapping
+
+import numpy as np
+
+try:
+    from numba import njit, prange
+    _HAVE_NUMBA = True
+except ImportError:
+    _HAVE_NUMBA = False
 
 
 class Category(Enum):
@@ -14,42 +26,213 @@ class Category(Enum):
     OTHER = "other"
 
 
+# Соответствие категорий целочисленным кодам для колоночного хранилища
+_CAT_INDEX: Dict[Category, int] = {category: index for index, category in enumerate(Category)}
+_CAT_BY_INDEX: List[Category] = list(Category)
+
+# Начальная ёмкость колоночных массивов
+_INITIAL_CAPACITY = 64
+
+# Монотонный генератор ID расходов: уникальность нужна только внутри процесса
+_id_counter = count(1)
+
+
+# Кэш текущей даты: date.today() дергает системные часы при каждом вызове
+_today_cache = [date.today(), time.monotonic()]
+
+
+def _today() -> date:
+    """Текущая дата с ленивым обновлением не чаще раза в минуту"""
+    now = time.monotonic()
+    if now - _today_cache[1] > 60.0:
+        _today_cache[0] = date.today()
+        _today_cache[1] = now
+    return _today_cache[0]
+
+
+@lru_cache(maxsize=1024)
+def _month_bounds(year: int, month: int) -> Tuple[int, int]:
+    """Ординалы первого и последнего дня месяца"""
+    last_day = calendar.monthrange(year, month)[1]
+    return date(year, month, 1).toordinal(), date(year, month, last_day).toordinal()
+
+
+def _category_code(category: Category) -> int:
+    """Валидация категории на границе API и перевод в целочисленный код"""
+    try:
+        return _CAT_INDEX[category]
+    except (KeyError, TypeError):
+        raise ValueError("Invalid category") from None
+
+# Максимальный размер кэша запросов планировщика
+_CACHE_LIMIT = 64
+
+# Маркер отсутствия значения в кэше
+_CACHE_MISS = object()
+
+
+if _HAVE_NUMBA:
+    # Слитые ядра «сравнение + накопление» без временного массива-маски:
+    # позволяют отвечать на диапазонные запросы по несортированным колонкам
+    # одним проходом, не оплачивая ленивую пересортировку
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _range_sum(dates, amounts, lo, hi, n):
+        total = 0.0
+        for i in prange(n):
+            if lo <= dates[i] <= hi:
+                total += amounts[i]
+        return total
+
+    @njit(cache=True)
+    def _range_bincount(dates, amounts, cats, lo, hi, n, ncats):
+        totals = np.zeros(ncats, dtype=np.float64)
+        for i in range(n):
+            if lo <= dates[i] <= hi:
+                totals[cats[i]] += amounts[i]
+        return totals
+
+
 class Expense:
+    __slots__ = ("id", "description", "amount", "category", "_date_ord")
+
     def __init__(self, description: str, amount: float, category: Category, expense_date: date):
-        if not description or not description.strip():
+        stripped = description.strip() if description else ""
+        if not stripped:
             raise ValueError("Description cannot be empty")
         if amount <= 0:
             raise ValueError("Amount must be positive")
         if not isinstance(category, Category):
             raise ValueError("Invalid category")
-        if expense_date > date.today():
+        date_ord = expense_date.toordinal()
+        if date_ord > _today().toordinal():
             raise ValueError("Expense date cannot be in the future")
 
-        self.id = str(uuid.uuid4())
-        self.description = description.strip()
+        self.id = str(next(_id_counter))
+        self.description = stripped
         self.amount = amount
         self.category = category
-        self.date = expense_date
+        self._date_ord = date_ord
+
+    @property
+    def date(self) -> date:
+        return date.fromordinal(self._date_ord)
+
+    @classmethod
+    def _from_validated(cls, description: str, amount: float, category: Category,
+                        expense_date: date) -> "Expense":
+        """Создание расхода без повторной валидации (для массовой загрузки)"""
+        expense = cls.__new__(cls)
+        expense.id = str(next(_id_counter))
+        expense.description = description
+        expense.amount = amount
+        expense.category = category
+        expense._date_ord = expense_date.toordinal()
+        return expense
 
     def __repr__(self):
         return f"Expense({self.description}, ${self.amount}, {self.category.value}, {self.date})"
 
 
+class _CategoryMapView(Mapping):
+    """
+    Read-only отображение Category -> float поверх массива значений по кодам
+
+    Позволяет отдавать бюджеты наружу без копирования словаря.
+    """
+
+    __slots__ = ("_values",)
+
+    def __init__(self, values: List[float]):
+        self._values = values
+
+    def __getitem__(self, category: Category) -> float:
+        return self._values[_CAT_INDEX[category]]
+
+    def __iter__(self):
+        return iter(_CAT_BY_INDEX)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+
+class _ListView(Sequence):
+    """Read-only обёртка над внутренним списком без копирования"""
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: List[Expense]):
+        self._items = items
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+
+class _ExpensesView(Sequence):
+    """
+    Read-only представление списка расходов
+
+    Не копирует список при каждом обращении: материализует его лениво
+    и переиспользует, пока версия планировщика не изменилась.
+    """
+
+    __slots__ = ("_planner", "_items", "_seen_version")
+
+    def __init__(self, planner: "ExpensePlanner"):
+        self._planner = planner
+        self._items: List[Expense] = []
+        self._seen_version = -1
+
+    def _refresh(self) -> List[Expense]:
+        if self._seen_version != self._planner._version:
+            self._items = list(self._planner._expenses.values())
+            self._seen_version = self._planner._version
+        return self._items
+
+    def __len__(self) -> int:
+        return len(self._planner._expenses)
+
+    def __getitem__(self, index):
+        return self._refresh()[index]
+
+
 class ExpensePlanner:
     """
     Класс для управления личными финансами и планирования расходов
     """
 
     def __init__(self):
-        self._expenses: List[Expense] = []
-        self._category_budgets: Dict[Category, float] = {}
+        self._expenses: Dict[str, Expense] = {}
+        self._index_of: Dict[str, int] = {}
+        self._row_ids: List[str] = []
         self._monthly_budget: float = 0.0
+        # Накопленная сумма всех расходов для O(1)-сводки
+        self._total: float = 0.0
+        # Колоночное хранилище (SoA): параллельные массивы сумм, дат и категорий
+        self._amounts = np.empty(_INITIAL_CAPACITY, dtype=np.float64)
+        self._dates = np.empty(_INITIAL_CAPACITY, dtype=np.int64)
+        self._cats = np.empty(_INITIAL_CAPACITY, dtype=np.int8)
+        self._size = 0
+        # Префикс колонок [0:_sorted_size) отсортирован по дате; хвост досортировывается лениво
+        self._sorted_size = 0
+        # Кэш повторяющихся запросов; счётчик версий инвалидирует его при мутациях
+        self._version = 0
+        self._cache: Dict[Tuple, Any] = {}
         self._initialize_category_budgets()
+        # Read-only представления вместо копий на каждое обращение
+        self._expenses_view = _ExpensesView(self)
+        self._budgets_view = _CategoryMapView(self._category_budgets)
 
     def _initialize_category_budgets(self) -> None:
-        """Инициализация бюджетов для всех категорий"""
-        for category in Category:
-            self._category_budgets[category] = 0.0
+        """Инициализация бюджетов и накопленных сумм для всех категорий"""
+        # Плоские массивы, индексируемые кодом категории, вместо Enum-словарей
+        self._category_budgets: List[float] = [0.0] * len(Category)
+        self._category_totals: List[float] = [0.0] * len(Category)
+        # Покрывающий индекс: списки расходов по коду категории
+        self._by_category: List[List[Expense]] = [[] for _ in Category]
 
     def add_expense(self, description: str, amount: float, category: Category, expense_date: date) -> str:
         """
@@ -65,9 +248,120 @@ class ExpensePlanner:
             ID созданного расхода
         """
         expense = Expense(description, amount, category, expense_date)
-        self._expenses.append(expense)
+        self._expenses[expense.id] = expense
+        self._index_of[expense.id] = self._size
+        self._row_ids.append(expense.id)
+        self._ensure_capacity(self._size + 1)
+        row = self._size
+        code = _CAT_INDEX[expense.category]
+        self._amounts[row] = expense.amount
+        self._dates[row] = expense._date_ord
+        self._cats[row] = code
+        # Хронологическое добавление не нарушает отсортированность
+        if self._sorted_size == row and (row == 0 or self._dates[row - 1] <= self._dates[row]):
+            self._sorted_size = row + 1
+        self._size = row + 1
+        self._by_category[code].append(expense)
+        self._category_totals[code] += expense.amount
+        self._total += expense.amount
+        self._version += 1
         return expense.id
 
+    def add_expenses(self, rows: List[Tuple[str, float, Category, date]]) -> List[str]:
+        """
+        Массовое добавление расходов
+
+        Валидация и запись в колонки выполняются одним векторизованным
+        проходом вместо повторения add_expense в цикле.
+
+        Args:
+            rows: Последовательность кортежей (описание, сумма, категория, дата)
+
+        Returns:
+            Список ID созданных расходов
+        """
+        rows = list(rows)
+        if not rows:
+            return []
+        descriptions, amounts, categories, dates = zip(*rows)
+        return self.add_expense_bulk(descriptions, amounts, categories, dates)
+
+    def add_expense_bulk(self, descriptions: Sequence[str], amounts: Sequence[float],
+                         categories: Sequence[Category], dates: Sequence[date]) -> List[str]:
+        """
+        Массовое добавление расходов по колонкам
+
+        Колоночный вариант add_expenses: валидация и запись выполняются
+        одним векторизованным проходом по каждой колонке, с единственным
+        расширением ёмкости на всю партию.
+
+        Args:
+            descriptions: Описания расходов
+            amounts: Суммы расходов
+            categories: Категории расходов
+            dates: Даты расходов
+
+        Returns:
+            Список ID созданных расходов
+        """
+        descriptions = [desc.strip() if desc else "" for desc in descriptions]
+        if not descriptions:
+            return []
+        if not all(descriptions):
+            raise ValueError("Description cannot be empty")
+
+        n = len(descriptions)
+        cat_codes = np.fromiter((_category_code(cat) for cat in categories),
+                                dtype=np.int8, count=n)
+        amount_col = np.asarray(amounts, dtype=np.float64)
+        if not (amount_col > 0).all():
+            raise ValueError("Amount must be positive")
+        date_ords = np.fromiter((d.toordinal() for d in dates), dtype=np.int64, count=n)
+        if not (date_ords <= _today().toordinal()).all():
+            raise ValueError("Expense date cannot be in the future")
+
+        start = self._size
+        self._ensure_capacity(start + n)
+        self._amounts[start:start + n] = amount_col
+        self._dates[start:start + n] = date_ords
+        self._cats[start:start + n] = cat_codes
+
+        ids = []
+        row_data = zip(descriptions, amounts, categories, dates)
+        for offset, (description, amount, category, expense_date) in enumerate(row_data):
+            expense = Expense._from_validated(description, amount, category, expense_date)
+            self._expenses[expense.id] = expense
+            self._index_of[expense.id] = start + offset
+            self._row_ids.append(expense.id)
+            self._by_category[cat_codes[offset]].append(expense)
+            ids.append(expense.id)
+
+        batch_sorted = bool((date_ords[1:] >= date_ords[:-1]).all())
+        if (self._sorted_size == start and batch_sorted
+                and (start == 0 or self._dates[start - 1] <= date_ords[0])):
+            self._sorted_size = start + n
+        self._size = start + n
+
+        for code, subtotal in enumerate(np.bincount(cat_codes, weights=amount_col,
+                                                    minlength=len(Category))):
+            self._category_totals[code] += float(subtotal)
+        self._total += float(np.add.reduce(amount_col))
+        self._version += 1
+        return ids
+
+    def _ensure_capacity(self, required: int) -> None:
+        """Геометрическое расширение колоночных массивов"""
+        capacity = len(self._amounts)
+        if required <= capacity:
+            return
+        while capacity < required:
+            capacity *= 2
+        for attr in ("_amounts", "_dates", "_cats"):
+            old = getattr(self, attr)
+            new = np.empty(capacity, dtype=old.dtype)
+            new[:self._size] = old[:self._size]
+            setattr(self, attr, new)
+
     def remove_expense(self, expense_id: str) -> bool:
         """
         Удаление расхода по ID
@@ -81,9 +375,53 @@ class ExpensePlanner:
         if not expense_id:
             raise ValueError("Expense ID cannot be empty")
 
-        initial_count = len(self._expenses)
-        self._expenses = [exp for exp in self._expenses if exp.id != expense_id]
-        return len(self._expenses) < initial_count
+        removed_expense = self._expenses.pop(expense_id, None)
+        if removed_expense is None:
+            return False
+
+        # Удаление строки из колонок: последняя строка переносится на её место
+        index = self._index_of.pop(expense_id)
+        last = self._size - 1
+        if index != last:
+            self._amounts[index] = self._amounts[last]
+            self._dates[index] = self._dates[last]
+            self._cats[index] = self._cats[last]
+            moved_id = self._row_ids[last]
+            self._row_ids[index] = moved_id
+            self._index_of[moved_id] = index
+        self._row_ids.pop()
+        self._size = last
+        self._sorted_size = min(self._sorted_size, index, last)
+        code = _CAT_INDEX[removed_expense.category]
+        self._by_category[code].remove(removed_expense)
+        self._category_totals[code] -= removed_expense.amount
+        self._total -= removed_expense.amount
+        if last == 0:
+            # Пустая история: сбрасываем накопленные суммы, чтобы не копить дрейф округления
+            self._total = 0.0
+            self._category_totals = [0.0] * len(Category)
+        self._version += 1
+        return True
+
+    def _memoize(self, key: Tuple, value: Any) -> Any:
+        """Сохранение значения в кэше с FIFO-вытеснением"""
+        if len(self._cache) >= _CACHE_LIMIT:
+            del self._cache[next(iter(self._cache))]
+        self._cache[key] = value
+        return value
+
+    def _ensure_sorted(self) -> None:
+        """Ленивая досортировка колонок по дате перед диапазонным запросом"""
+        n = self._size
+        if self._sorted_size == n:
+            return
+        order = np.argsort(self._dates[:n], kind="stable")
+        self._amounts[:n] = self._amounts[:n][order]
+        self._dates[:n] = self._dates[:n][order]
+        self._cats[:n] = self._cats[:n][order]
+        self._row_ids = [self._row_ids[i] for i in order]
+        self._index_of = {row_id: i for i, row_id in enumerate(self._row_ids)}
+        self._sorted_size = n
 
     def set_monthly_budget(self, budget: float) -> None:
         """
@@ -95,6 +433,7 @@ class ExpensePlanner:
         if budget < 0:
             raise ValueError("Budget cannot be negative")
         self._monthly_budget = budget
+        self._version += 1
 
     def set_category_budget(self, category: Category, budget: float) -> None:
         """
@@ -104,12 +443,11 @@ class ExpensePlanner:
             category: Категория расходов
             budget: Бюджет для категории
         """
-        if not isinstance(category, Category):
-            raise ValueError("Invalid category")
+        code = _category_code(category)
         if budget < 0:
             raise ValueError("Budget cannot be negative")
 
-        self._category_budgets[category] = budget
+        self._category_budgets[code] = budget
 
     def get_total_expenses(self, start_date: date, end_date: date) -> float:
         """
@@ -127,13 +465,20 @@ class ExpensePlanner:
         if start_date > end_date:
             raise ValueError("Start date cannot be after end date")
 
-        total = 0.0
-        for expense in self._expenses:
-            if start_date <= expense.date <= end_date:
-                total += expense.amount
-        return total
+        return self._range_total(start_date.toordinal(), end_date.toordinal())
+
+    def _range_total(self, start_ord: int, end_ord: int) -> float:
+        """Сумма расходов в диапазоне ординалов дат"""
+        n = self._size
+        if _HAVE_NUMBA and self._sorted_size < n:
+            # Грязный хвост: один слитый проход вместо пересортировки
+            return float(_range_sum(self._dates, self._amounts, start_ord, end_ord, n))
+        self._ensure_sorted()
+        lo = np.searchsorted(self._dates[:n], start_ord, side="left")
+        hi = np.searchsorted(self._dates[:n], end_ord, side="right")
+        return float(np.add.reduce(self._amounts[lo:hi]))
 
-    def get_expenses_by_category(self, category: Category) -> List[Expense]:
+    def get_expenses_by_category(self, category: Category) -> Sequence[Expense]:
         """
         Получение всех расходов по категории
 
@@ -143,10 +488,7 @@ class ExpensePlanner:
         Returns:
             Список расходов указанной категории
         """
-        if not isinstance(category, Category):
-            raise ValueError("Invalid category")
-
-        return [exp for exp in self._expenses if exp.category == category]
+        return _ListView(self._by_category[_category_code(category)])
 
     def get_remaining_monthly_budget(self, year: int, month: int) -> float:
         """
@@ -162,16 +504,13 @@ class ExpensePlanner:
         if not 1 <= month <= 12:
             raise ValueError("Month must be between 1 and 12")
 
-        start_date = date(year, month, 1)
-        # Расчет последнего дня месяца
-        if month == 12:
-            end_date = date(year, month, 31)
-        else:
-            end_date = date(year, month + 1, 1)
-            end_date = end_date.replace(day=end_date.day - 1)
+        key = ("remaining_monthly_budget", year, month, self._version)
+        cached = self._cache.get(key, _CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            return cached
 
-        total_expenses = self.get_total_expenses(start_date, end_date)
-        return self._monthly_budget - total_expenses
+        total_expenses = self._range_total(*_month_bounds(year, month))
+        return self._memoize(key, self._monthly_budget - total_expenses)
 
     def is_category_budget_exceeded(self, category: Category) -> bool:
         """
@@ -183,15 +522,9 @@ class ExpensePlanner:
         Returns:
             True если бюджет превышен, иначе False
         """
-        if not isinstance(category, Category):
-            raise ValueError("Invalid category")
-
-        category_budget = self._category_budgets[category]
-        if category_budget == 0:
-            return False
-
-        category_expenses = sum(exp.amount for exp in self.get_expenses_by_category(category))
-        return category_expenses > category_budget
+        code = _category_code(category)
+        category_budget = self._category_budgets[code]
+        return category_budget != 0 and self._category_totals[code] > category_budget
 
     def get_category_statistics(self, start_date: date, end_date: date) -> Dict[Category, float]:
         """
@@ -207,11 +540,28 @@ class ExpensePlanner:
         if not start_date or not end_date:
             raise ValueError("Dates cannot be None")
 
-        statistics = {}
-        for expense in self._expenses:
-            if start_date <= expense.date <= end_date:
-                statistics[expense.category] = statistics.get(expense.category, 0.0) + expense.amount
-        return statistics
+        key = ("category_statistics", start_date, end_date, self._version)
+        cached = self._cache.get(key, _CACHE_MISS)
+        if cached is not _CACHE_MISS:
+            return dict(cached)
+
+        n = self._size
+        start_ord = start_date.toordinal()
+        end_ord = end_date.toordinal()
+        if _HAVE_NUMBA and self._sorted_size < n:
+            # Грязный хвост: один слитый проход вместо пересортировки
+            sums = _range_bincount(self._dates, self._amounts, self._cats,
+                                   start_ord, end_ord, n, len(Category))
+        else:
+            self._ensure_sorted()
+            lo = np.searchsorted(self._dates[:n], start_ord, side="left")
+            hi = np.searchsorted(self._dates[:n], end_ord, side="right")
+            sums = np.bincount(self._cats[lo:hi], weights=self._amounts[lo:hi],
+                               minlength=len(Category))
+        statistics = {_CAT_BY_INDEX[code]: float(total)
+                      for code, total in enumerate(sums) if total > 0}
+        self._memoize(key, statistics)
+        return dict(statistics)
 
     def get_top_expenses(self, limit: int) -> List[Expense]:
         """
@@ -226,8 +576,15 @@ class ExpensePlanner:
         if limit <= 0:
             raise ValueError("Limit must be positive")
 
-        sorted_expenses = sorted(self._expenses, key=lambda x: x.amount, reverse=True)
-        return sorted_expenses[:limit]
+        n = self._size
+        if limit >= n:
+            return sorted(self._expenses.values(), key=attrgetter("amount"), reverse=True)
+
+        # Частичная сортировка: O(n) отбор limit крупнейших вместо полной O(n log n)
+        amounts = self._amounts[:n]
+        top = np.argpartition(amounts, n - limit)[n - limit:]
+        top = top[np.argsort(amounts[top])[::-1]]
+        return [self._expenses[self._row_ids[row]] for row in top]
 
     def get_expenses_summary(self) -> Dict:
         """
@@ -236,25 +593,24 @@ class ExpensePlanner:
         Returns:
             Словарь со сводной информацией
         """
-        total_expenses = sum(exp.amount for exp in self._expenses)
-        avg_expense = total_expenses / len(self._expenses) if self._expenses else 0
+        avg_expense = self._total / len(self._expenses) if self._expenses else 0
 
         return {
-            "total_expenses": total_expenses,
+            "total_expenses": self._total,
             "expense_count": len(self._expenses),
             "average_expense": avg_expense,
             "monthly_budget": self._monthly_budget,
-            "category_budgets": self._category_budgets.copy()
+            "category_budgets": self._budgets_view
         }
 
     # Property методы для доступа к данным
     @property
-    def expenses(self) -> List[Expense]:
-        return self._expenses.copy()
+    def expenses(self) -> Sequence[Expense]:
+        return self._expenses_view
 
     @property
     def monthly_budget(self) -> float:
         return self._monthly_budget
 
     def get_category_budget(self, category: Category) -> float:
-        return self._category_budgets[category]
\ No newline at end of file
+        return self._category_budgets[_category_code(category)]
\ No newline at end of file
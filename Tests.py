@@ -17,15 +17,17 @@ class TestExpensePlanner:
         today = date.today()
         yesterday = today - timedelta(days=1)
 
-        # Добавляем тестовые расходы
-        expense1_id = planner.add_expense("Lunch", 25.50, Category.FOOD, yesterday)
-        expense2_id = planner.add_expense("Bus ticket", 5.0, Category.TRANSPORT, today)
-        expense3_id = planner.add_expense("Movie", 15.0, Category.ENTERTAINMENT, today)
+        # Добавляем тестовые расходы одним массовым вызовом
+        ids = planner.add_expenses([
+            ("Lunch", 25.50, Category.FOOD, yesterday),
+            ("Bus ticket", 5.0, Category.TRANSPORT, today),
+            ("Movie", 15.0, Category.ENTERTAINMENT, today)
+        ])
 
         return {
-            'food_id': expense1_id,
-            'transport_id': expense2_id,
-            'entertainment_id': expense3_id
+            'food_id': ids[0],
+            'transport_id': ids[1],
+            'entertainment_id': ids[2]
         }
 
     # Тест 1: Добавление валидного расхода
@@ -106,8 +108,8 @@ class TestExpensePlanner:
         """Параметризованный тест расчета общей суммы расходов"""
         today = date.today()
 
-        for desc, amount, category in expenses_data:
-            planner.add_expense(desc, amount, category, today)
+        planner.add_expenses([(desc, amount, category, today)
+                              for desc, amount, category in expenses_data])
 
         total = planner.get_total_expenses(today, today)
         assert total == expected_total
@@ -0,0 +1,17 @@
+from setuptools import setup
+
+try:
+    from Cython.Build import cythonize
+    # Компиляция модуля в расширение: C-уровневый доступ к атрибутам
+    # и диспетчеризация методов без изменения API
+    ext_modules = cythonize(["Main.py"], language_level=3)
+except ImportError:
+    # Без Cython модуль импортируется как чистый Python
+    ext_modules = []
+
+setup(
+    name="okis-expense-planner",
+    version="1.0",
+    py_modules=["Main"],
+    ext_modules=ext_modules,
+)